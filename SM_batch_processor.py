@@ -4,14 +4,26 @@
 import os
 import sys
 import gzip
+import zlib
 import shutil
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import time
 import re
 import concurrent.futures
+import queue
 import threading
 import json
+import hashlib
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library parser
+    _json_loads = json.loads
 
 # Determine the correct path for config.json
 if getattr(sys, 'frozen', False):
@@ -25,22 +37,77 @@ if not os.path.exists(CONFIG_FILE):
     raise FileNotFoundError(f"Configuration file not found: {CONFIG_FILE}")
 
 with open(CONFIG_FILE) as f:
-    config = json.load(f)
+    config = _json_loads(f.read())
 
 API_KEY = config.get("API_KEY")
 if not API_KEY:
     raise ValueError("API_KEY is missing in config.json.")
 
 
-with open("config.json") as f:
-    config = json.load(f)
+# Patterns used on every downloaded model file
+_SANITIZE_RE = re.compile(r'[^A-Za-z0-9_.-]')
+_CLUSTER_RE = re.compile(r'cluster_(\d+)')
 
-API_KEY = config.get("API_KEY")
+# Status value in a raw job summary payload, read without a full JSON parse
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"([A-Z_]+)"')
+
+# Start of a FASTA header line, allowing indentation before the ">"
+_FASTA_HEADER_RE = re.compile(rb"\n[ \t\x0b\x0c\x1c-\x1f]*>")
+
+# Every byte that is not a residue letter, "?" or "-", including newlines and non-ASCII bytes
+_FASTA_DELETE_BYTES = bytes(c for c in range(256) if not (chr(c).isascii() and chr(c).isalpha() or chr(c) in "?-"))
+
+
+def _parse_retry_after(value, default):
+    """Returns the delay in seconds requested by a Retry-After header, or the default."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _file_digest(path):
+    """Returns the sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(256 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _conditional_headers(response):
+    """Builds If-None-Match/If-Modified-Since headers from a response's cache validators."""
+    headers = {}
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
 
-if not API_KEY:
-    raise ValueError("API_KEY is missing. Set it in config.json.")
 
-print(f"API Key loaded: {API_KEY}")
+class TokenBucket:
+    """Thread-safe token bucket that spreads calls evenly over a rate limit window."""
+
+    def __init__(self, rate=100, per=60):
+        self.rate = rate
+        self.per = per
+        # Start empty and hold at most one token, so no window of `per` seconds exceeds `rate` calls
+        self.tokens = 0.0
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(1.0, self.tokens + (now - self.last) * self.rate / self.per)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) * self.per / self.rate
+            time.sleep(wait_time)  # Sleep outside the lock so other threads can refill too
 
 
 class SwissModelAPI:
@@ -48,32 +115,83 @@ class SwissModelAPI:
 
     RAPID_RATE_LIMIT = 100  # Max 100 requests per minute
     REQUEST_INTERVAL = 60  # Wait 1 minute between requests
-
-    def __init__(self, token, fasta_path, template_path, out_dir):
+    POLL_INTERVAL = 2  # First status poll delay in seconds
+    POLL_BACKOFF = 1.5  # Growth factor between consecutive status polls
+    MAX_POLL_INTERVAL = 30  # Upper bound on the status poll delay
+    TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "ERROR"})
+    TERMINAL_STATUS_TOKENS = tuple(f'"{status}"'.encode() for status in sorted(TERMINAL_STATUSES))
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Copy buffer size for streamed model downloads
+    REQUEST_TIMEOUT = (10, 35)  # Connect and read timeouts in seconds for every API call
+    SUBMIT_URL = "https://swissmodel.expasy.org/user_template"
+
+    def __init__(self, token, fasta_path, template_path, out_dir, max_workers=None, use_cache=True, refresh_cache=False):
         self.token = token
         self.headers = {"Authorization": f"Token {self.token}"}
         self.fasta_path = fasta_path
         self.template_path = template_path
         self.out_dir = out_dir
         os.makedirs(self.out_dir, exist_ok=True)
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self.cache_dir = os.path.join(self.out_dir, ".cache")
         self.sequences = self._load_fasta_sequences()
         self.template_coordinates = self._load_template()
-        self.lock = threading.Lock()  # Lock to prevent race conditions
+        self.max_workers = max_workers or self.default_max_workers()
+        self.session = self._create_session()
+        self.bucket = TokenBucket(self.RAPID_RATE_LIMIT, self.REQUEST_INTERVAL)
+        self.results_lock = threading.Lock()  # Guards the per-project download bookkeeping
+        self.known_dirs = set()  # Output directories already created during this run
+        self.dir_lock = threading.Lock()
+
+    @classmethod
+    def default_max_workers(cls):
+        """Returns the default thread count for the I/O-bound worker pools."""
+        return min(cls.RAPID_RATE_LIMIT, (os.cpu_count() or 1) * 5)
+
+    def _create_session(self):
+        """Creates a pooled HTTP session that keeps connections alive and retries transient errors."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,  # Hand the final response back so callers can inspect it
+        )
+        # Submissions are not idempotent: a resent POST after a read timeout or gateway error may
+        # create a duplicate project, so only retry failed connects and responses the server rejected
+        submit_retry = Retry(
+            total=5,
+            read=0,
+            backoff_factor=1,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+        )
+        # The submit, monitor and download stages can each have max_workers requests in flight;
+        # size the per-host pool to match so no connection is discarded and re-handshaked
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=3 * self.max_workers, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # requests picks the longest matching prefix, so submissions use their own retry policy
+        session.mount(self.SUBMIT_URL, HTTPAdapter(pool_maxsize=self.max_workers, max_retries=submit_retry))
+        return session
 
     def _load_fasta_sequences(self):
         """Reads and cleans a FASTA file to extract valid sequences."""
-        valid_chars = re.compile(r"[^A-Za-z?-]")
-        sequences = {}
+        with open(self.fasta_path, "rb") as file:
+            data = file.read()
 
-        with open(self.fasta_path, "r") as file:
-            seq_id = None
-            for line in file:
-                line = line.strip()
-                if line.startswith(">"):
-                    seq_id = line[1:]
-                    sequences[seq_id] = ""
-                elif seq_id:
-                    sequences[seq_id] += re.sub(valid_chars, "", line)
+        # Normalize CRLF and CR-only line endings, as text-mode universal newlines would
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        sequences = {}
+        # Prepend a newline so a header on the first line splits like every other; text before it is dropped
+        for record in _FASTA_HEADER_RE.split(b"\n" + data)[1:]:
+            header, _, body = record.partition(b"\n")
+            seq_id = header.decode().rstrip()
+            sequences[seq_id] = body.translate(None, _FASTA_DELETE_BYTES).decode("ascii") if seq_id else ""
 
         return sequences  # Dictionary: {sequence_id: sequence}
 
@@ -82,51 +200,90 @@ class SwissModelAPI:
         with open(self.template_path, "r") as file:
             return file.read()
 
+    def _cache_key(self, sequence):
+        """Returns the cache key for modeling a sequence against the loaded template."""
+        return hashlib.sha256((sequence + self.template_coordinates).encode()).hexdigest()
+
+    def _load_cached_results(self, key, seq_ids):
+        """Returns True if a cache entry holds unchanged output files for every given sequence ID."""
+        try:
+            with open(os.path.join(self.cache_dir, key)) as file:
+                cached = json.load(file)  # Dictionary: {sequence_id: [[relative output path, sha256]]}
+            # Output paths are not unique per sequence and template, so a later run may have
+            # overwritten them; only trust files whose content still matches the recorded digest
+            return all(
+                cached.get(seq_id) and all(_file_digest(os.path.join(self.out_dir, path)) == digest
+                                           for path, digest in cached[seq_id])
+                for seq_id in seq_ids
+            )
+        except (OSError, ValueError, TypeError, AttributeError):  # Missing files or a malformed entry
+            return False
+
+    def _save_cached_results(self, key, results):
+        """Records the output paths and their digests produced for each sequence ID under a cache key."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {seq_id: [[os.path.relpath(path, self.out_dir), _file_digest(path)] for path in paths]
+                 for seq_id, paths in results.items()}
+        with open(os.path.join(self.cache_dir, key), "w") as file:
+            json.dump(entry, file)
+
     def submit_request(self, seq_id, sequence):
         """Submits a sequence to SwissModel API with retry handling."""
-        attempt = 1
-        while attempt <= 5:
-            try:
-                response = requests.post(
-                    "https://swissmodel.expasy.org/user_template",
-                    headers=self.headers,
-                    json={"target_sequences": [sequence], "template_coordinates": self.template_coordinates, "project_title": f"Batch Submission - {seq_id}"},
-                )
-                
-                if response.status_code == 429:  # Rate limit hit
-                    wait_time = attempt * 10
-                    print(f"Rate limit hit. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    attempt += 1
-                    continue
-
-                response.raise_for_status()
-                return seq_id, response.json().get("project_id")
-
-            except requests.RequestException as e:
-                print(f"Request error for {seq_id}: {e}")
-                return seq_id, None
+        self.bucket.acquire()  # Stay within the rapid submission rate limit
+        try:
+            response = self.session.post(
+                self.SUBMIT_URL,
+                json={"target_sequences": [sequence], "template_coordinates": self.template_coordinates, "project_title": f"Batch Submission - {seq_id}"},
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            return seq_id, response.json().get("project_id")
+
+        except requests.RequestException as e:
+            print(f"Request error for {seq_id}: {e}")
+            return seq_id, None
 
     def monitor_job_status(self, seq_id, project_id):
-        """Monitors SwissModel job status until completion."""
+        """Monitors SwissModel job status until completion, backing off between polls."""
+        attempt = 0
+        conditional_headers = {}  # Validators from the last full response, sent back on the next poll
         while True:
-            time.sleep(10)  # Reduce server polling frequency
+            delay = min(self.MAX_POLL_INTERVAL, self.POLL_INTERVAL * self.POLL_BACKOFF ** attempt)
             try:
-                status_response = requests.get(
+                status_response = self.session.get(
                     f"https://swissmodel.expasy.org/project/{project_id}/models/summary/",
-                    headers=self.headers,
+                    headers=conditional_headers,
+                    timeout=self.REQUEST_TIMEOUT,
                 )
-                status_response.raise_for_status()
-                status_json = status_response.json()
-                status = status_json.get("status", "UNKNOWN")
-                print(f"Job {project_id} for {seq_id} status: {status}")
-                if status in ["COMPLETED", "FAILED"]:
-                    return status_json if status == "COMPLETED" else None
-            except requests.RequestException:
+                if status_response.status_code == 304:  # Payload unchanged since the last poll
+                    print(f"Job {project_id} for {seq_id} status: unchanged")
+                elif status_response.status_code == 429:  # Rate limit hit, honor the server's hint
+                    delay = _parse_retry_after(status_response.headers.get("Retry-After"), delay)
+                    print(f"Rate limit hit while polling {project_id}. Retrying in {delay:.0f} seconds...")
+                else:
+                    status_response.raise_for_status()
+                    conditional_headers = _conditional_headers(status_response)
+                    body = status_response.content
+                    # A job can only be finished if a terminal status appears in the payload;
+                    # skip the full JSON parse on the common still-running polls
+                    if not any(token in body for token in self.TERMINAL_STATUS_TOKENS):
+                        status_match = _STATUS_RE.search(body)
+                        status = status_match.group(1).decode() if status_match else "UNKNOWN"
+                        print(f"Job {project_id} for {seq_id} status: {status}")
+                    else:
+                        status_json = _json_loads(body)
+                        status = status_json.get("status", "UNKNOWN")
+                        print(f"Job {project_id} for {seq_id} status: {status}")
+                        if status in self.TERMINAL_STATUSES:
+                            return status_json if status == "COMPLETED" else None
+            except (requests.RequestException, ValueError):  # ValueError covers malformed JSON
                 print(f"Error fetching job status for {project_id}. Retrying...")
 
+            time.sleep(delay)  # Poll immediately, then back off geometrically
+            attempt += 1
+
     def fetch_model_results(self, seq_id, status_json):
-        """Fetches and saves URLs of generated models."""
+        """Fetches the URLs of generated models as download tasks."""
         model_data = []
         for i, model in enumerate(status_json.get("models", []), start=1):
             if "modelcif_url" in model:
@@ -136,15 +293,21 @@ class SwissModelAPI:
 
         if not model_data:
             print(f"No models were generated for {seq_id}. Skipping download.")
-            return
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            executor.map(self._download_and_extract, model_data)
+        return model_data
+
 
+    def _ensure_dir(self, path):
+        """Creates a directory once per run, skipping the syscalls for directories already seen."""
+        with self.dir_lock:
+            if path not in self.known_dirs:
+                os.makedirs(path, exist_ok=True)
+                self.known_dirs.add(path)
 
-    def sanitize_filename(self, filename):
+    @staticmethod
+    def sanitize_filename(filename):
         """Removes invalid characters for PyMOL compatibility."""
-        return re.sub(r'[^A-Za-z0-9_.-]', '_', filename)
+        return _SANITIZE_RE.sub('_', filename)
 
     def _download_and_extract(self, model_data):
         """Downloads and extracts gzipped model files with proper naming."""
@@ -152,7 +315,7 @@ class SwissModelAPI:
         raw_filename = url.split("/")[-1]
 
         # Extract cluster number from the sequence ID (e.g., "cluster_3_medoid")
-        cluster_match = re.search(r'cluster_(\d+)', seq_id)
+        cluster_match = _CLUSTER_RE.search(seq_id)
         cluster_number = cluster_match.group(1) if cluster_match else "unknown"
 
         # Determine the subdirectory based on file type
@@ -165,50 +328,151 @@ class SwissModelAPI:
 
         # Assign correct cluster subdirectory
         cluster_folder = os.path.join(self.out_dir, f"cluster_{cluster_number}_model", sub_folder)
-        os.makedirs(cluster_folder, exist_ok=True)  # Ensure subdirectory exists
+        self._ensure_dir(cluster_folder)  # Ensure subdirectory exists
 
         # Generate unique filenames with type differentiation
         safe_filename = self.sanitize_filename(f"cluster_{cluster_number}_model_{model_number:03}{file_extension}")
         filename = os.path.join(cluster_folder, safe_filename)
 
-        with self.lock:  # Prevent race conditions
-            try:
-                response = requests.get(url)
+        try:
+            is_gzipped = raw_filename.endswith(".gz")
+            with self.session.get(url, stream=True, timeout=self.REQUEST_TIMEOUT) as response:
                 response.raise_for_status()
-                with open(filename, "wb") as file:
-                    file.write(response.content)
-
-                if filename.endswith(".gz"):
-                    extracted_filename = filename.replace(".gz", "")
-                    with gzip.open(filename, 'rb') as f_in, open(extracted_filename, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                    os.remove(filename)
-                    print(f"Extracted {extracted_filename}")
-                else:
-                    print(f"Saved {filename}")
-
-            except requests.RequestException as e:
-                print(f"Failed to download {url}: {e}")
+                response.raw.decode_content = True  # Undo any transfer Content-Encoding
+                # Decompress straight from the network stream, no intermediate .gz on disk
+                source = gzip.GzipFile(fileobj=response.raw) if is_gzipped else response.raw
+                # Write to a per-thread sibling file and rename, so concurrent writers never interleave;
+                # a plain exclusive open keeps the usual umask-based permissions on the final file
+                temp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.part"
+                file = open(temp_filename, "xb")
+                try:
+                    with file:
+                        shutil.copyfileobj(source, file, length=self.DOWNLOAD_CHUNK_SIZE)
+                    os.replace(temp_filename, filename)
+                except BaseException:
+                    os.remove(temp_filename)
+                    raise
+
+            print(f"{'Extracted' if is_gzipped else 'Saved'} {filename}")
+            return filename
+
+        # Reading response.raw surfaces urllib3 errors (ProtocolError, ReadTimeoutError, DecodeError) unwrapped
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            print(f"Failed to download {url}: {e}")
+        except (OSError, EOFError, zlib.error) as e:  # Corrupt or truncated gzip stream
+            print(f"Failed to extract {url}: {e}")
+
+    def _submit_stage(self, seq_ids, sequence, monitor_queue):
+        """Submits one unique sequence shared by seq_ids and queues its project for monitoring."""
+        # Guard the submission so one failure does not stop the stage, like the other stages
+        try:
+            key = self._cache_key(sequence)
+            if self.use_cache and not self.refresh_cache and self._load_cached_results(key, seq_ids):
+                print(f"Models for {', '.join(seq_ids)} found in cache. Skipping submission.")
+                return
+
+            seq_id, project_id = self.submit_request(seq_ids[0], sequence)
+        except Exception as e:
+            print(f"Failed to submit {', '.join(seq_ids)}: {e}")
+            return
 
+        if project_id:
+            print(f"Project {project_id} for {', '.join(seq_ids)} started successfully.")
+            monitor_queue.put((seq_ids, key, project_id))
 
+    def _monitor_stage(self, monitor_queue, download_queue):
+        """Polls queued projects until a None sentinel and queues each model file of completed ones."""
+        while True:
+            item = monitor_queue.get()
+            if item is None:
+                return
+            seq_ids, key, project_id = item
+            # Guard each project so one failure does not take this worker out of the stage
+            try:
+                status_json = self.monitor_job_status(seq_ids[0], project_id)
+                if not status_json:
+                    continue
 
+                # Identical sequences share one project; save its models under every matching ID
+                model_data = [data for seq_id in seq_ids for data in self.fetch_model_results(seq_id, status_json)]
+            except Exception as e:
+                print(f"Failed to monitor project {project_id} for {', '.join(seq_ids)}: {e}")
+                continue
+            project = {"key": key, "remaining": len(model_data), "results": {seq_id: [] for seq_id in seq_ids}}
+            for data in model_data:
+                download_queue.put((project, data))
+
+    def _download_stage(self, download_queue):
+        """Downloads queued model files until a None sentinel and caches each finished project."""
+        while True:
+            item = download_queue.get()
+            if item is None:
+                return
+            project, model_data = item
+            # Guard each file so one failure does not take this worker out of the stage;
+            # a None path still counts towards completion but keeps the project out of the cache
+            try:
+                path = self._download_and_extract(model_data)
+            except Exception as e:
+                print(f"Failed to download {model_data[1]}: {e}")
+                path = None
+
+            with self.results_lock:
+                project["results"][model_data[0]].append(path)
+                project["remaining"] -= 1
+                finished = project["remaining"] == 0
+
+            # Only cache complete results so a partial download is retried on the next run
+            if finished and self.use_cache and all(None not in paths for paths in project["results"].values()):
+                try:
+                    self._save_cached_results(project["key"], project["results"])
+                except OSError as e:
+                    print(f"Failed to write cache entry {project['key']}: {e}")
+
+    @staticmethod
+    def _drain_stage(workers, stage_queue):
+        """Stops a stage's workers with one sentinel each and re-raises any worker error."""
+        for _ in workers:
+            stage_queue.put(None)
+        for worker in workers:
+            worker.result()
 
     def process_sequences(self):
         """Main function to process and submit sequences."""
         if not self.sequences:
             raise ValueError("No valid sequences found in the FASTA file.")
-        print(f"Loaded {len(self.sequences)} valid sequences.")
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_seq = {executor.submit(self.submit_request, seq_id, seq): seq_id for seq_id, seq in self.sequences.items()}
-            
-            for future in concurrent.futures.as_completed(future_to_seq):
-                seq_id, project_id = future.result()
-                if project_id:
-                    print(f"Project {project_id} for {seq_id} started successfully.")
-                    status_json = self.monitor_job_status(seq_id, project_id)
-                    if status_json:
-                        self.fetch_model_results(seq_id, status_json)
+
+        # Group IDs by sequence so duplicates are modeled once instead of spending extra submissions
+        unique_sequences = {}
+        for seq_id, seq in self.sequences.items():
+            unique_sequences.setdefault(seq, []).append(seq_id)
+        print(f"Loaded {len(self.sequences)} valid sequences ({len(unique_sequences)} unique).")
+
+        # Submit, monitor and download run as separate stages linked by queues, so long-running
+        # status polls never hold up new submissions or downloads of already finished projects
+        monitor_queue = queue.Queue()
+        download_queue = queue.Queue()
+        stage_workers = min(len(unique_sequences), self.max_workers)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=stage_workers) as submit_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=stage_workers) as monitor_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as download_pool:
+            monitor_workers = [monitor_pool.submit(self._monitor_stage, monitor_queue, download_queue)
+                               for _ in range(stage_workers)]
+            download_workers = [download_pool.submit(self._download_stage, download_queue)
+                                for _ in range(self.max_workers)]
+            submissions = []
+            try:
+                submissions = [submit_pool.submit(self._submit_stage, seq_ids, seq, monitor_queue)
+                               for seq, seq_ids in unique_sequences.items()]
+            finally:
+                # Let every submission finish enqueueing before the sentinels go in behind them
+                concurrent.futures.wait(submissions)
+                try:
+                    self._drain_stage(monitor_workers, monitor_queue)
+                finally:
+                    self._drain_stage(download_workers, download_queue)
+            for future in submissions:
+                future.result()
 
         print("All sequences processed successfully!")
 
@@ -218,11 +482,21 @@ def main():
     parser.add_argument("fasta_path", type=str, help="Path to input FASTA file.")
     parser.add_argument("template_path", type=str, help="Path to input template PDB file.")
     parser.add_argument("out_dir", type=str, help="Directory to save model outputs.")
+    parser.add_argument("--max-workers", type=int, default=None,
+                        help=f"Number of parallel worker threads (default: {SwissModelAPI.default_max_workers()}).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not read or write the local results cache.")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Ignore cached results and resubmit every sequence, updating the cache.")
     args = parser.parse_args()
 
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be a positive integer.")
+
     TOKEN = API_KEY  # Replace with your actual token
 
-    swiss_model = SwissModelAPI(TOKEN, args.fasta_path, args.template_path, args.out_dir)
+    swiss_model = SwissModelAPI(TOKEN, args.fasta_path, args.template_path, args.out_dir, args.max_workers,
+                                use_cache=not args.no_cache, refresh_cache=args.refresh_cache)
     swiss_model.process_sequences()
 
 